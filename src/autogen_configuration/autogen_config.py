@@ -1,23 +1,48 @@
 from src.configs.logging.logging_config import setup_logging
 import autogen
-from autogen import config_list_from_json
 import logging
 from dotenv import load_dotenv
 
+import functools
+import json
 import os
 
 setup_logging()
 
 logger = logging.getLogger(__name__)
 
-dotenv_path = os.path.normpath(os.path.join(
-    os.path.dirname(__file__), '..', '..', '.env'))
+# Only read the .env file when the environment has not already been
+# populated (e.g. by the container runtime).
+if not (os.environ.get('OPENAI_API_KEY') and os.environ.get('OPENAI_MODEL')):
+    dotenv_path = os.path.normpath(os.path.join(
+        os.path.dirname(__file__), '..', '..', '.env'))
 
-try:
-    load_dotenv(dotenv_path=dotenv_path)
-    logger.info("Environment variables loaded successfully.")
-except Exception as e:
-    logger.error("Failed to load the .env file.", exc_info=e)
+    try:
+        load_dotenv(dotenv_path=dotenv_path)
+        logger.info("Environment variables loaded successfully.")
+    except Exception as e:
+        logger.error("Failed to load the .env file.", exc_info=e)
+
+_API_KEY = os.getenv('OPENAI_API_KEY') or ''
+if not _API_KEY:
+    logger.error('OPENAI_API_KEY not found in environment variables')
+
+CONFIG_PATH = 'src/autogen_configuration/utils/oai_config_list.json'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_raw_config_list(config_path: str) -> list:
+    """
+    Reads and parses the config list file once per process.
+
+    Args:
+        config_path (str): The path to the config list JSON file.
+
+    Returns:
+        list: The raw config list. Callers must not mutate it.
+    """
+    with open(config_path, 'rb') as file:
+        return json.load(file)
 
 
 class GetConfig:
@@ -42,9 +67,7 @@ class GetConfig:
             None
         """
         logger.info('Initializing GetConfig class')
-        self.api_key = os.environ.get('OPENAI_API_KEY', '')
-        if not self.api_key:
-            logger.error('OPENAI_API_KEY not found in environment variables')
+        self.api_key = _API_KEY
         self.config_list = self.load_and_enrich_config_list()
 
     @property
@@ -72,15 +95,14 @@ class GetConfig:
         Returns:
             dict: The enriched config list.
         """
-        config_path = 'src/autogen_configuration/utils/oai_config_list.json'
+        model = os.environ.get('OPENAI_MODEL', '')
         try:
-            config_list = config_list_from_json(
-                env_or_file=config_path,
-                filter_dict={"model": os.environ.get('OPENAI_MODEL', '')}
-            )
+            raw_config_list = _load_raw_config_list(CONFIG_PATH)
             logger.info('Config list loaded successfully')
-            for config in config_list:
-                config['api_key'] = self.api_key
+            config_list = [
+                {**config, 'api_key': self.api_key}
+                for config in raw_config_list if config.get('model') == model
+            ]
             logger.info('Config list enriched with API key')
         except Exception as e:
             logger.error(
@@ -89,5 +111,18 @@ class GetConfig:
         return {'config_list': config_list}
 
 
-# test
-config = GetConfig()
+_CONFIG = GetConfig()
+
+
+def get_llm_config() -> dict:
+    """
+    Returns the enriched config list of the module-level GetConfig instance,
+    which is built once at import.
+
+    Args:
+        None
+
+    Returns:
+        dict: The enriched config list.
+    """
+    return _CONFIG.config_list
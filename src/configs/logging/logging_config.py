@@ -5,10 +5,13 @@ from typing import Optional
 
 from src.configs.logging.color_formatter import ColoredFormatter
 
+_LOGGING_CONFIGURED = False
+
 
 def setup_logging(default_path: str = 'src/configs/logging/logging_config.json', default_level: int = logging.INFO) -> None:
     """
-    Setup logging configuration.
+    Setup logging configuration. Only the first call configures logging;
+    subsequent calls are no-ops.
 
     Args:
         default_path (str): The default path to the logging configuration file.
@@ -17,6 +20,10 @@ def setup_logging(default_path: str = 'src/configs/logging/logging_config.json',
     Returns:
         None
     """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+
     path = default_path
     try:
         if os.path.exists(path):
@@ -33,5 +40,6 @@ def setup_logging(default_path: str = 'src/configs/logging/logging_config.json',
                     logging.getLogger().handlers[0].setFormatter(formatter)
         else:
             logging.basicConfig(level=default_level)
+        _LOGGING_CONFIGURED = True
     except Exception as e:
         print(f"Error occurred while setting up logging: {e}")
@@ -4,18 +4,9 @@ import logging
 import autogen
 from autogen.agentchat.contrib.gpt_assistant_agent import GPTAssistantAgent
 from src.configs.logging.logging_config import setup_logging
-from src.oai_agent.utils.load_assistant_id import load_assistant_id
+from src.oai_agent.utils.load_assistant_id import load_assistant_id, clear_assistant_id_cache
 from src.oai_agent.utils.create_oai_agent import create_agent
-from src.autogen_configuration.autogen_config import GetConfig
-from src.tools.read_url import read_url
-from src.tools.scroll import scroll
-from src.tools.jump_to_search_engine import jump_to_search_engine
-from src.tools.go_back import go_back
-from src.tools.wait import wait
-from src.tools.click_element import click_element
-from src.tools.input_text import input_text
-from src.tools.analyze_content import analyze_content
-from src.tools.save_to_file import save_to_file
+from src.autogen_configuration.autogen_config import get_llm_config
 
 import openai
 from autogen.agentchat import AssistantAgent
@@ -25,16 +16,16 @@ from fastapi.middleware.cors import CORSMiddleware
 import websockets
 import json
 import requests
-
-from src.webdriver.webdriver import WebDriver
-from src.tools.utils.get_webdriver_instance import get_webdriver_instance
+import threading
+import functools
+import importlib
 
 app = FastAPI()
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allows all origins
-    allow_credentials=True,
+    allow_credentials=False,  # No cookies or auth headers are used
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
 )
@@ -45,64 +36,115 @@ class PromptRequest(BaseModel):
 setup_logging()
 logger = logging.getLogger(__name__)
 
+_TOOL_NAMES = (
+    "analyze_content",
+    "click_element",
+    "go_back",
+    "input_text",
+    "jump_to_search_engine",
+    "read_url",
+    "scroll",
+    "wait",
+    "save_to_file",
+)
+
+@functools.lru_cache(maxsize=1)
+def get_function_map() -> dict:
+    # Tools pull in Playwright and the vision helpers, so they are only
+    # imported once the first agent is registered.
+    return {
+        name: getattr(importlib.import_module(f"src.tools.{name}"), name)
+        for name in _TOOL_NAMES
+    }
+
+_OAI_TEMPLATE = {"config_list": get_llm_config()["config_list"]}
+
+_agent_cache: dict[str, GPTAssistantAgent] = {}
+_agent_cache_lock = threading.Lock()
+
 def configure_agent(assistant_type: str) -> GPTAssistantAgent:
+    with _agent_cache_lock:
+        gpt_assistant = _agent_cache.get(assistant_type)
+        if gpt_assistant is None:
+            gpt_assistant = create_gpt_assistant(assistant_type)
+            register_functions(gpt_assistant)
+            _agent_cache[assistant_type] = gpt_assistant
+    return gpt_assistant
+
+def evict_agent(assistant_type: str) -> None:
+    with _agent_cache_lock:
+        _agent_cache.pop(assistant_type, None)
+
+def create_gpt_assistant(assistant_type: str) -> GPTAssistantAgent:
     try:
-        logger.info("Configuring GPT Assistant Agent...")
-        assistant_id = load_assistant_id(assistant_type)
-        llm_config = GetConfig().config_list
-        oai_config = {
-            "config_list": llm_config["config_list"], "assistant_id": assistant_id}
-        gpt_assistant = GPTAssistantAgent(
-            name=assistant_type, instructions=AssistantAgent.DEFAULT_SYSTEM_MESSAGE, llm_config=oai_config
-        )
-        logger.info("GPT Assistant Agent configured.")
-        return gpt_assistant
-    except openai.NotFoundError:
-        logger.warning("Assistant not found. Creating new assistant...")
-        create_agent(assistant_type)
-        return configure_agent()
+        try:
+            return build_gpt_assistant(assistant_type)
+        except openai.NotFoundError:
+            # Create the assistant and retry once; a second NotFoundError propagates.
+            logger.warning("Assistant not found. Creating new assistant...")
+            create_agent(assistant_type)
+            clear_assistant_id_cache()
+            return build_gpt_assistant(assistant_type)
     except Exception as e:
         logger.error(f"Unexpected error during agent configuration: {str(e)}")
         raise
 
+def build_gpt_assistant(assistant_type: str) -> GPTAssistantAgent:
+    logger.info("Configuring GPT Assistant Agent...")
+    assistant_id = load_assistant_id(assistant_type)
+    oai_config = {**_OAI_TEMPLATE, "assistant_id": assistant_id}
+    gpt_assistant = GPTAssistantAgent(
+        name=assistant_type, instructions=AssistantAgent.DEFAULT_SYSTEM_MESSAGE, llm_config=oai_config
+    )
+    logger.info("GPT Assistant Agent configured.")
+    return gpt_assistant
+
 def register_functions(agent):
     logger.info("Registering functions...")
-    function_map = {
-        "analyze_content": analyze_content,
-        "click_element": click_element,
-        "go_back": go_back,
-        "input_text": input_text,
-        "jump_to_search_engine": jump_to_search_engine,
-        "read_url": read_url,
-        "scroll": scroll,
-        "wait": wait,
-        "save_to_file": save_to_file,
-    }
-    agent.register_function(function_map=function_map)
+    agent.register_function(function_map=get_function_map())
     logger.info("Functions registered.")
 
+_CODE_EXEC_CFG = {"work_dir": "coding", "use_docker": False}
+
+def _is_terminate(msg, _t="TERMINATE"):
+    return _t in msg["content"]
+
+_user_proxy_local = threading.local()
+
 def create_user_proxy():
+    user_proxy = getattr(_user_proxy_local, "user_proxy", None)
+    if user_proxy is not None:
+        return user_proxy
     logger.info("Creating User Proxy Agent...")
     user_proxy = autogen.UserProxyAgent(
         name="user_proxy",
-        is_termination_msg=lambda msg: "TERMINATE" in msg["content"],
+        is_termination_msg=_is_terminate,
         human_input_mode="NEVER",
-        code_execution_config={
-            "work_dir": "coding",
-            "use_docker": False,
-        },
+        # autogen writes back into this dict, so give each agent its own copy
+        code_execution_config=dict(_CODE_EXEC_CFG),
     )
+    _user_proxy_local.user_proxy = user_proxy
     logger.info("User Proxy Agent created.")
     return user_proxy
 
 
+def run_chat(prompt: str):
+    user_proxy = create_user_proxy()
+    gpt_assistant = configure_agent("BrowsingAgent")
+    try:
+        return user_proxy.initiate_chat(gpt_assistant, message=prompt)
+    except openai.NotFoundError:
+        # The cached agent's assistant was deleted server-side; rebuild it once.
+        logger.warning("Cached assistant not found. Recreating agent...")
+        evict_agent("BrowsingAgent")
+        gpt_assistant = configure_agent("BrowsingAgent")
+        return user_proxy.initiate_chat(gpt_assistant, message=prompt)
+
+
 @app.post("/get-web-agent-response")
 def get_response(prompt_request: PromptRequest):
     try:
-        gpt_assistant = configure_agent("BrowsingAgent")
-        register_functions(gpt_assistant)
-        user_proxy = create_user_proxy();
-        response = user_proxy.initiate_chat(gpt_assistant, message=prompt_request.prompt)
+        response = run_chat(prompt_request.prompt)
         # get the browser instance and close the browser once done
         # WebDriver.getInstance().closeDriver();
         return {"response": response}
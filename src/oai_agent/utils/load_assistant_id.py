@@ -3,15 +3,55 @@ from src.configs.logging.logging_config import setup_logging
 import logging
 import json
 import datetime
+import functools
 
 setup_logging()
 logger = logging.getLogger()
 
 
+@functools.lru_cache(maxsize=8)
+def _read_assistant_id(assistant_type: str) -> str:
+    """
+    Read the latest assistant ID for the given type from the assistant ID file.
+
+    Only successful lookups are cached; errors propagate and are retried on the
+    next call.
+
+    Args:
+    - assistant_type (str): The type of assistant to load.
+
+    Returns:
+    - assistant_id (str): The assistant ID.
+    """
+    with open("src/data/assistant_id.json", "r") as file:
+        data = json.load(file)
+        filtered_data = [
+            entry for entry in data if entry['type'] == assistant_type]
+        latest_entry = max(filtered_data, key=lambda x: datetime.datetime.strptime(
+            x['date'], "%Y-%m-%d %H:%M:%S.%f"))
+        return latest_entry['id']
+
+
+def clear_assistant_id_cache() -> None:
+    """
+    Clear the cached assistant IDs. Call this after the assistant ID file has
+    been updated.
+
+    Args:
+    - None
+
+    Returns:
+    - None
+    """
+    _read_assistant_id.cache_clear()
+
+
 def load_assistant_id(assistant_type: str) -> str:
     """
     Load the assistant ID from the assistant ID file.
 
+    Successful lookups are cached per assistant type; failures are not.
+
     Args:
     - assistant_type (str): The type of assistant to load.
 
@@ -19,13 +59,7 @@ def load_assistant_id(assistant_type: str) -> str:
     - assistant_id (str): The assistant ID. 
     """
     try:
-        with open("src/data/assistant_id.json", "r") as file:
-            data = json.load(file)
-            filtered_data = [
-                entry for entry in data if entry['type'] == assistant_type]
-            latest_entry = max(filtered_data, key=lambda x: datetime.datetime.strptime(
-                x['date'], "%Y-%m-%d %H:%M:%S.%f"))
-            assistant_id = latest_entry['id']
+        assistant_id = _read_assistant_id(assistant_type)
     except FileNotFoundError:
         logger.error("Assistant ID file not found.")
         return None
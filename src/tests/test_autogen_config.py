@@ -8,23 +8,27 @@ class TestGetConfig(unittest.TestCase):
     def setUp(self):
         self.get_config = GetConfig()
 
-    @patch('src.autogen_configuration.autogen_config.config_list_from_json')
-    def test_load_and_enrich_config_list(self, mock_config_list_from_json):
+    @patch('src.autogen_configuration.autogen_config._load_raw_config_list')
+    def test_load_and_enrich_config_list(self, mock_load_raw_config_list):
         mock_config_list = [
             {'model': 'model1'},
             {'model': 'model2'}
         ]
-        mock_config_list_from_json.return_value = mock_config_list
+        mock_load_raw_config_list.return_value = mock_config_list
 
         expected_config_list = [
-            {'model': 'model1', 'api_key': 'test_api_key'},
-            {'model': 'model2', 'api_key': 'test_api_key'}
+            {'model': 'model1', 'api_key': 'test_api_key'}
         ]
 
         self.get_config.api_key = 'test_api_key'
-        config_list = self.get_config.load_and_enrich_config_list()
+        with patch.dict('os.environ', {'OPENAI_MODEL': 'model1'}):
+            config_list = self.get_config.load_and_enrich_config_list()
 
         self.assertEqual(config_list['config_list'], expected_config_list)
+        self.assertEqual(mock_config_list, [
+            {'model': 'model1'},
+            {'model': 'model2'}
+        ])
 
 
 if __name__ == '__main__':
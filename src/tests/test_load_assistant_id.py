@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import patch, mock_open
+from src.oai_agent.utils.load_assistant_id import load_assistant_id, clear_assistant_id_cache
+
+
+ASSISTANT_ID_DATA = '''[
+    {"type": "BrowsingAgent", "id": "asst_old", "date": "2024-01-01 00:00:00.000000"},
+    {"type": "BrowsingAgent", "id": "asst_new", "date": "2024-02-01 00:00:00.000000"}
+]'''
+
+
+class TestLoadAssistantId(unittest.TestCase):
+
+    def setUp(self):
+        clear_assistant_id_cache()
+        self.addCleanup(clear_assistant_id_cache)
+
+    def test_failed_lookup_is_not_cached(self):
+        with patch('builtins.open', side_effect=FileNotFoundError):
+            self.assertIsNone(load_assistant_id("BrowsingAgent"))
+
+        with patch('builtins.open', mock_open(read_data=ASSISTANT_ID_DATA)) as mock_file:
+            self.assertEqual(load_assistant_id("BrowsingAgent"), "asst_new")
+            mock_file.assert_called_once()
+
+    def test_successful_lookup_is_cached(self):
+        with patch('builtins.open', mock_open(read_data=ASSISTANT_ID_DATA)) as mock_file:
+            load_assistant_id("BrowsingAgent")
+            self.assertEqual(load_assistant_id("BrowsingAgent"), "asst_new")
+            mock_file.assert_called_once()
+
+    def test_clear_assistant_id_cache(self):
+        with patch('builtins.open', mock_open(read_data=ASSISTANT_ID_DATA)) as mock_file:
+            load_assistant_id("BrowsingAgent")
+            clear_assistant_id_cache()
+            load_assistant_id("BrowsingAgent")
+            self.assertEqual(mock_file.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,15 @@ from unittest.mock import patch, mock_open
 import os
 import logging.config
 # Assuming your updated code is in a file named log_config.py
+from src.configs.logging import logging_config
 from src.configs.logging.logging_config import setup_logging
 
 
 class TestSetupLogging(unittest.TestCase):
 
+    def setUp(self):
+        logging_config._LOGGING_CONFIGURED = False
+
     @patch('os.path.exists', return_value=True)
     @patch('builtins.open', new_callable=mock_open, read_data='{"version": 1}')
     @patch('logging.config.dictConfig')
@@ -27,6 +31,14 @@ class TestSetupLogging(unittest.TestCase):
             'src/configs/logging/logging_config.json')
         mock_basic_config.assert_called_once_with(level=logging.INFO)
 
+    @patch('os.path.exists', return_value=False)
+    @patch('logging.basicConfig')
+    def test_configures_only_once(self, mock_basic_config, mock_exists):
+        setup_logging()
+        setup_logging()
+        mock_exists.assert_called_once()
+        mock_basic_config.assert_called_once_with(level=logging.INFO)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import httpx
+import openai
+
+from src.oai_agent import oai_agent
+
+
+def not_found_error():
+    request = httpx.Request("GET", "https://api.openai.com/v1/assistants")
+    return openai.NotFoundError(
+        "Not found", response=httpx.Response(404, request=request), body=None)
+
+
+class TestConfigureAgent(unittest.TestCase):
+
+    def setUp(self):
+        oai_agent._agent_cache.clear()
+        patchers = [
+            patch('src.oai_agent.oai_agent.GPTAssistantAgent'),
+            patch('src.oai_agent.oai_agent.create_agent'),
+            patch('src.oai_agent.oai_agent.register_functions'),
+            patch('src.oai_agent.oai_agent.load_assistant_id',
+                  return_value='asst_test'),
+            patch('src.oai_agent.oai_agent.create_user_proxy'),
+        ]
+        (self.mock_gpt_assistant_agent, self.mock_create_agent,
+         self.mock_register_functions, _, self.mock_create_user_proxy) = [
+            patcher.start() for patcher in patchers]
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+        self.addCleanup(oai_agent._agent_cache.clear)
+
+    def test_configure_agent_returns_cached_agent(self):
+        first = oai_agent.configure_agent("BrowsingAgent")
+        second = oai_agent.configure_agent("BrowsingAgent")
+
+        self.assertIs(first, second)
+        self.mock_gpt_assistant_agent.assert_called_once()
+        self.mock_register_functions.assert_called_once_with(first)
+
+    def test_not_found_from_chat_evicts_and_rebuilds_once(self):
+        stale_agent, fresh_agent = MagicMock(), MagicMock()
+        self.mock_gpt_assistant_agent.side_effect = [stale_agent, fresh_agent]
+        user_proxy = self.mock_create_user_proxy.return_value
+        user_proxy.initiate_chat.side_effect = [not_found_error(), "done"]
+
+        oai_agent.configure_agent("BrowsingAgent")
+        response = oai_agent.run_chat("prompt")
+
+        self.assertEqual(response, "done")
+        self.assertEqual(self.mock_gpt_assistant_agent.call_count, 2)
+        user_proxy.initiate_chat.assert_called_with(
+            fresh_agent, message="prompt")
+        self.assertIs(oai_agent._agent_cache["BrowsingAgent"], fresh_agent)
+        self.mock_create_agent.assert_not_called()
+
+    def test_persistent_not_found_calls_create_agent_once(self):
+        self.mock_gpt_assistant_agent.side_effect = not_found_error()
+
+        with self.assertRaises(openai.NotFoundError):
+            oai_agent.run_chat("prompt")
+
+        self.mock_create_agent.assert_called_once_with("BrowsingAgent")
+        self.assertEqual(self.mock_gpt_assistant_agent.call_count, 2)
+        self.assertNotIn("BrowsingAgent", oai_agent._agent_cache)
+        self.mock_create_user_proxy.return_value.initiate_chat.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,58 +1,59 @@
 import unittest
 from unittest.mock import patch, MagicMock
+from src.webdriver import webdriver
 from src.webdriver.webdriver import WebDriver
-import locale
-from tzlocal import get_localzone_name
 
 
 class TestWebDriver(unittest.TestCase):
 
     def setUp(self):
+        WebDriver._WebDriver__instance = None
+        patcher = patch('src.webdriver.webdriver.sync_playwright')
+        self.mock_sync_playwright = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_playwright = self.mock_sync_playwright.return_value.start.return_value
+        self.mock_browser = self.mock_playwright.chromium.launch.return_value
+        self.mock_context = self.mock_browser.new_context.return_value
         self.webdriver = WebDriver.getInstance()
 
     def tearDown(self):
         self.webdriver.closeDriver()
+        WebDriver._WebDriver__instance = None
 
-    @patch('src.webdriver.webdriver.sync_playwright')
-    def test_createDriver(self, mock_sync_playwright):
-        mock_playwright = MagicMock()
-        mock_browser = MagicMock()
-        mock_page = MagicMock()
-        mock_sync_playwright.return_value.start.return_value = mock_playwright
-        mock_playwright.chromium.launch_persistent_context.return_value = mock_browser
-        mock_browser.new_page.return_value = mock_page
-
-        self.webdriver.createDriver()
-
-        mock_sync_playwright.assert_called_once()
-        timezone_id = get_localzone_name()
-        system_locale = locale.getlocale()
-        mock_sync_playwright.return_value.start.assert_called_once()
-        mock_playwright.chromium.launch_persistent_context.assert_called_once_with(
-            user_data_dir="src/data/chrome_profile",
-            headless=False,
-            args=[
-                "--disable-gpu",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-web-security",
-                "--allow-running-insecure-content",
-            ],
-            locale=system_locale[0],
-            timezone_id=timezone_id,
+    def test_getInstance_does_not_launch_browser(self):
+        self.assertIs(WebDriver.getInstance(), self.webdriver)
+        self.mock_sync_playwright.assert_not_called()
+
+    def test_createDriver(self):
+        self.webdriver.getDriver()
+
+        self.mock_browser.new_context.assert_called_once_with(
+            viewport={"width": 960, "height": 1080},
+            locale=webdriver._SYSTEM_LOCALE,
+            timezone_id=webdriver._TZ_ID,
         )
-        mock_browser.new_page.assert_called_once()
-        mock_page.set_viewport_size.assert_called_once_with(
-            {"width": 960, "height": 1080})
+        self.mock_context.new_page.assert_called_once()
+        self.mock_browser.new_page.assert_not_called()
 
     def test_getDriver(self):
         page = self.webdriver.getDriver()
-        self.assertIsNotNone(page)
+        self.assertIs(self.webdriver.getDriver(), page)
+        self.assertIs(page, self.mock_context.new_page.return_value)
+        self.mock_sync_playwright.return_value.start.assert_called_once()
+        self.mock_playwright.chromium.launch.assert_called_once()
 
     def test_closeCurrentTab(self):
+        old_page, new_page = MagicMock(), MagicMock()
+        old_page.is_closed.return_value = False
+        self.mock_context.new_page.side_effect = [old_page, new_page]
+        self.webdriver.getDriver()
+
         self.webdriver.closeCurrentTab()
-        page = self.webdriver.getDriver()
-        self.assertIsNotNone(page)
+
+        old_page.close.assert_called_once()
+        self.assertIs(self.webdriver.getDriver(), new_page)
+        self.assertEqual(self.mock_context.new_page.call_count, 2)
+        self.mock_browser.new_page.assert_not_called()
 
 
 if __name__ == '__main__':
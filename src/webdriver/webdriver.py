@@ -8,6 +8,9 @@ import os
 setup_logging()
 logger = logging.getLogger()
 
+_TZ_ID = get_localzone_name()
+_SYSTEM_LOCALE = (locale.getdefaultlocale()[0] or "en-US").replace("_", "-")
+
 
 class WebDriver:
     """
@@ -21,7 +24,7 @@ class WebDriver:
         createDriver(*args, **kwargs) -> None:
             Creates a new browser instance and sets up the page.
         getDriver() -> Page:
-            Returns the current page instance.
+            Returns the current page instance, launching the browser on first use.
         closeDriver() -> None:
             Closes the browser instance and stops Playwright.
         closeCurrentTab() -> None:
@@ -48,7 +51,8 @@ class WebDriver:
 
     def __init__(self, *args, **kwargs):
         """
-        Initializes the WebDriver class.
+        Initializes the WebDriver class. The browser is launched lazily on the
+        first call to getDriver().
 
         Args:
             *args: Variable length argument list.
@@ -61,11 +65,15 @@ class WebDriver:
             raise Exception("This class is a singleton!")
         else:
             WebDriver.__instance = self
-            self.createDriver(*args, **kwargs)
+            self._launch_args = args
+            self._launch_kwargs = kwargs
+            self._launched = False
+            self.page = None
 
     def createDriver(self, *args, **kwargs):
         """
-        Creates a new browser instance and sets up the page.
+        Creates a new browser instance and sets up the page. Does nothing if
+        the browser has already been launched.
 
         Args:
             *args: Variable length argument list.
@@ -74,14 +82,13 @@ class WebDriver:
         Returns:
             None
         """
-        timezone_id = get_localzone_name()
-        system_locale = locale.getdefaultlocale()
-        if system_locale[0] is None:
-            system_locale = "en-US"
- 
+        if self._launched:
+            return
+
         try:
             logger.info("Starting Playwright...")
             playwright = sync_playwright().start()
+            self.playwright = playwright
             logger.info("Launching Chromium browser...")
             browser = playwright.chromium.launch(
                 headless=False,
@@ -100,11 +107,16 @@ class WebDriver:
                 }
             )
             logger.info("Creating new browser context...")
-            context = browser.new_context()
+            context = browser.new_context(
+                viewport={"width": 960, "height": 1080},
+                locale=_SYSTEM_LOCALE,
+                timezone_id=_TZ_ID
+            )
             logger.info("Opening new page...")
             self.browser = browser
-            self.page = browser.new_page()
-            self.page.set_viewport_size({"width": 960, "height": 1080})
+            self.context = context
+            self.page = context.new_page()
+            self._launched = True
             logger.info("Browser instance created successfully.")
         except Exception as e:
             logger.error("Failed to create browser instance.", exc_info=True)
@@ -112,7 +124,7 @@ class WebDriver:
 
     def getDriver(self):
         """
-        Returns the current page instance.
+        Returns the current page instance, launching the browser on first use.
 
         Args:
             None
@@ -120,6 +132,8 @@ class WebDriver:
         Returns:
             Page: The current page instance.
         """
+        if not self._launched:
+            self.createDriver(*self._launch_args, **self._launch_kwargs)
         return self.page
 
     def closeDriver(self):
@@ -132,9 +146,14 @@ class WebDriver:
         Returns:
             None
         """
+        if not self._launched:
+            return
+
         try:
             self.browser.close()
             self.playwright.stop()
+            self.page = None
+            self._launched = False
             logger.info("Browser instance closed successfully.")
         except Exception as e:
             logger.error("Failed to close browser instance.", exc_info=True)
@@ -153,8 +172,7 @@ class WebDriver:
         if self.page and not self.page.is_closed():
             try:
                 self.page.close()
-                self.page = self.browser.new_page()
-                self.page.set_viewport_size({"width": 960, "height": 1080})
+                self.page = self.context.new_page()
                 logger.info("Current tab closed successfully.")
             except Exception as e:
                 logger.error("Failed to close current tab.", exc_info=True)